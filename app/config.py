@@ -1,7 +1,28 @@
-from pydantic_settings import BaseSettings
+import json
+import os
 
-class Settings(BaseSettings):
-    eth_model_path: str = "trained_models/model_eth.onnx"
-    allowed_origins: list[str] = ["*"]
+def _env(name: str, default: str) -> str:
+    # Match variable names case-insensitively, as pydantic-settings did
+    value = os.environ.get(name)
+    if value is not None:
+        return value
+    lowered = name.lower()
+    for key, value in os.environ.items():
+        if key.lower() == lowered:
+            return value
+    return default
+
+def _parse_list(value: str) -> list[str]:
+    # Accept both the JSON list format pydantic-settings used and a plain comma-separated list
+    if value.lstrip().startswith("["):
+        items = json.loads(value)
+        if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+            raise ValueError(f"Expected a JSON list of strings, got: {value}")
+        return items
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+class Settings:
+    eth_model_path: str = _env("ETH_MODEL_PATH", "trained_models/model_eth.ort")
+    allowed_origins: list[str] = _parse_list(_env("ALLOWED_ORIGINS", "*"))
 
 settings = Settings()
@@ -1,13 +1,16 @@
 from contextlib import asynccontextmanager
-import uuid
+import itertools
+import os
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+import orjson
 
 from app.models.prediction import PredictionResponse
+from app.services.exchange import close_exchange, load_exchange
 from app.services.loader import load_model
 from app.services.predictor import get_prediction_values
-from app.utils.logger import get_logger
+from app.utils.logger import get_logger, request_id_var
 from app.config import settings
 
 logger = get_logger(__name__)
@@ -16,27 +19,46 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     """
     Asynchronous context manager to handle application startup and shutdown events.
-    Loads the ONNX machine learning model into memory.
+    Loads the ONNX machine learning model and the shared exchange client into memory.
     """
     load_model()
+    await load_exchange()
     yield
     # --- Cleanup on shutdown ---
     logger.info("Application shutdown: Clearing ML models...")
+    await close_exchange()
     
 
 # --- FastAPI App Initialization ---
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # --- Request ID Middleware ---
+# Request IDs are "<random process prefix>-<counter>" in hex. The random prefix keeps them
+# unique across workers, replicas and restarts (PIDs repeat in containers), and a counter
+# is much cheaper than calling uuid4 per request.
+_id_prefix = os.urandom(8).hex()
+_request_counter = itertools.count()
+
+def _reset_request_ids():
+    global _id_prefix, _request_counter
+    _id_prefix = os.urandom(8).hex()
+    _request_counter = itertools.count()
+
+# Forked workers (e.g. gunicorn --preload) must not reuse the parent's prefix
+os.register_at_fork(after_in_child=_reset_request_ids)
+
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    # You can store the request_id in a context variable if you need to access it in other places
-    # from contextvars import ContextVar
-    # request_id_var = ContextVar('request_id', default=None)
-    # request_id_var.set(request_id)
-    logger.info(f"Request ID: {request_id} - Path: {request.url.path}")
-    response = await call_next(request)
+    # Liveness probes are frequent and uninteresting; skip ID generation and logging
+    if request.url.path == "/health":
+        return await call_next(request)
+    request_id = f"{_id_prefix}-{next(_request_counter):x}"
+    # Expose the ID to every log record emitted while handling this request
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
     response.headers["X-Request-ID"] = request_id
     return response
 
@@ -52,12 +74,22 @@ app.add_middleware(
 # --- Exception Handler ---
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled error: {exc}")
+    logger.error("Unhandled error: %s", exc)
     return JSONResponse(status_code=500, content={"error": "Internal Server Error"})
 
 
 # --- API Endpoints ---
-@app.post("/prediction", response_model=PredictionResponse)
+# Pre-serialized response bodies: only the prediction value varies between calls
+_POSITIVE_PREFIX = b'{"prediction":"positive","tokenToBuy":"ETH","value":'
+_NEGATIVE_PREFIX = b'{"prediction":"negative","tokenToBuy":"ETH","value":'
+_ERROR_BODY = orjson.dumps({"prediction": "error", "tokenToBuy": None, "value": None})
+
+def _prediction_response(prefix: bytes, value: float) -> Response:
+    return Response(prefix + orjson.dumps(value) + b"}", media_type="application/json")
+
+# Responses are built directly instead of being re-validated through pydantic;
+# PredictionResponse is kept for the OpenAPI schema only.
+@app.post("/prediction", response_model=None, responses={200: {"model": PredictionResponse}})
 async def get_prediction():
     """
     Performs a prediction based on real market data.
@@ -65,22 +97,32 @@ async def get_prediction():
     a valid response structure, defaulting to a "negative" prediction on any failure.
     """
     try:
-        result = get_prediction_values()
+        result = await get_prediction_values()
         
         if result["trend"] == 'positive':
-            return {"prediction": "positive", "tokenToBuy": "ETH", "value": result["value"]}
+            return _prediction_response(_POSITIVE_PREFIX, result["value"])
         else:
-            return {"prediction": "negative", "tokenToBuy": "ETH", "value": result["value"]}
+            return _prediction_response(_NEGATIVE_PREFIX, result["value"])
 
     except Exception as e:
         # Centralized error logging for any failure in the prediction pipeline
-        logger.error(f"An error occurred in the prediction endpoint: {e}", exc_info=True)
+        logger.error("An error occurred in the prediction endpoint: %s", e, exc_info=True)
         # Return the default negative response as per requirements
-        return {"prediction": "error", "tokenToBuy": None, "value": None}
+        return Response(_ERROR_BODY, media_type="application/json")
+
+# Serialized once; a Response is still created per request because middlewares mutate its headers
+_ROOT_BODY = orjson.dumps({"status": "Prediction API is running"})
 
 @app.get("/")
 def read_root():
     """
     Root endpoint to check if the API is running.
     """
-    return {"status": "Prediction API is running"}
+    return Response(_ROOT_BODY, media_type="application/json")
+
+@app.get("/health", status_code=204)
+def health():
+    """
+    Liveness probe endpoint. Returns 204 No Content.
+    """
+    return Response(status_code=204)
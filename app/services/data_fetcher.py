@@ -1,48 +1,45 @@
+import time
 from typing import Optional
 import numpy as np
-import ccxt
+from app.services.exchange import get_exchange
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def get_data_coinbase(ticker: str) -> Optional[np.ndarray]:
+async def get_data_coinbase(ticker: str) -> Optional[np.ndarray]:
     """
-    Fetches and prepares the last 5 days of OHLCV data for a given ticker from Coinbase
+    Fetches and prepares the last 4 closed days of OHLCV data for a given ticker from Coinbase
     using only standard Python libraries and numpy. Returns a numpy array ready for the model.
     """
-    exchange = ccxt.coinbase()
+    exchange = get_exchange()
     symbol = f"{ticker}/USD"
     timeframe = "1d"
-    limit = 5  # Fetch 5 days to have enough data for 3 lags
+    limit = 5  # Today's still-open candle is included, leaving 4 closed days for 3 lags
 
     try:
-        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-        
-        if not ohlcv or len(ohlcv) < 4:
-            logger.warning(f"Not enough data from Coinbase for {ticker} (need at least 4 days, got {len(ohlcv)})")
-            return None
-
-        # Data is [timestamp, open, high, low, close, volume]
-        # We only need the 'close' price (index 4). Data is ordered oldest to newest.
-        close_prices = [candle[4] for candle in ohlcv]
+        ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
 
-        # Calculate percentage change
-        pct_changes = []
-        for i in range(1, len(close_prices)):
-            change = (close_prices[i] - close_prices[i-1]) / close_prices[i-1]
-            pct_changes.append(change)
+        # Drop today's candle: its close is the live price and would change all day.
+        # Only closed days feed the model, so lag_1 is yesterday's change.
+        today_start_ms = int(time.time() // 86400) * 86400 * 1000
+        ohlcv = [candle for candle in ohlcv or [] if candle[0] < today_start_ms]
 
-        if len(pct_changes) < 3:
-            logger.warning(f"Not enough percentage changes to create lags (need 3, got {len(pct_changes)})")
+        if len(ohlcv) < 4:
+            logger.warning("Not enough closed days from Coinbase for %s (need at least 4, got %d)", ticker, len(ohlcv))
             return None
 
-        # The model expects features [lag_1, lag_2, lag_3].
-        # lag_1 is the most recent change (yesterday's), which is pct_changes[-1].
-        features = [pct_changes[-1], pct_changes[-2], pct_changes[-3]]
-        
-        # Return as a numpy array, reshaped for the model (1 sample, 3 features)
-        return np.array(features, dtype=np.float32).reshape(1, -1)
-        
+        # Data is [timestamp, open, high, low, close, volume], ordered oldest to newest.
+        # Only the last 4 'close' prices (index 4) are needed for 3 percentage changes.
+        closes = np.fromiter((candle[4] for candle in ohlcv[-4:]), dtype=np.float64, count=4)
+
+        # The model expects features [lag_1, lag_2, lag_3], where lag_1 is the most
+        # recent change, so the oldest-to-newest changes are written in reverse.
+        # This runs once per coalesced cache miss, so each in-flight computation gets
+        # its own buffer; the model's pre-bound input buffer is only touched under lock.
+        features = np.empty((1, 3), dtype=np.float32)
+        np.divide(closes[1:] - closes[:-1], closes[:-1], out=features[0, ::-1])
+        return features
+
     except Exception as e:
-        logger.error(f"Error fetching data for {ticker} from Coinbase: {e}", exc_info=True)
+        logger.error("Error fetching data for %s from Coinbase: %s", ticker, e, exc_info=True)
         raise
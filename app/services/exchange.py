@@ -0,0 +1,38 @@
+import ccxt.async_support as ccxt
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+exchanges = {}
+
+async def load_exchange():
+    """
+    Creates the process-wide async Coinbase client so every request reuses the same
+    HTTP session (and its pooled TLS connections) instead of building a new one.
+    """
+    logger.info("Application startup: Initializing Coinbase exchange client...")
+    exchange = ccxt.coinbase({'enableRateLimit': False})
+    exchanges["coinbase"] = exchange
+    try:
+        # Pre-warm the markets metadata so the first request doesn't pay for it
+        await exchange.load_markets()
+        logger.info("Coinbase markets loaded successfully.")
+    except Exception as e:
+        logger.warning("Could not pre-load Coinbase markets; they will be fetched on first use. Error: %s", e)
+
+async def close_exchange():
+    """
+    Closes the shared Coinbase client and its underlying HTTP session.
+    """
+    exchange = exchanges.pop("coinbase", None)
+    if exchange is not None:
+        await exchange.close()
+
+def get_exchange():
+    """
+    Returns the shared Coinbase client, creating it if startup didn't.
+    """
+    exchange = exchanges.get("coinbase")
+    if exchange is None:
+        exchange = exchanges["coinbase"] = ccxt.coinbase({'enableRateLimit': False})
+    return exchange
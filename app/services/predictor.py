@@ -1,10 +1,75 @@
-from app.services.loader import get_model
+import asyncio
+import threading
+import time
+import numpy as np
+from app.services.loader import get_model, ml_models
 from app.services.data_fetcher import get_data_coinbase
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def get_prediction_values() -> dict:
+# The IOBinding buffers are shared, so only one inference may use them at a time
+_model_lock = threading.Lock()
+
+# Model inputs come from daily candles, so results are memoized per (ticker, UTC day)
+_cache: dict[tuple[str, int], dict] = {}
+
+# Cache misses already being computed, so concurrent callers share a single fetch
+_inflight: dict[tuple[str, int], asyncio.Task] = {}
+
+def _run_model(onnx_session, input_data) -> float:
+    """
+    Writes the features into the pre-bound input buffer and runs the cached
+    IOBinding; the result lands directly in out_buf.
+    """
+    in_buf = ml_models["in_buf"]
+    out_buf = ml_models["out_buf"]
+    with _model_lock:
+        np.copyto(in_buf, input_data)
+        onnx_session.run_with_iobinding(ml_models["io_binding"])
+        return float(out_buf[0, 0])
+
+def _utc_day() -> int:
+    """
+    Returns the number of days since the Unix epoch in UTC.
+    """
+    return int(time.time() // 86400)
+
+async def get_prediction_values() -> dict:
+    """
+    Returns the prediction for the current UTC day, computing it on the first
+    request of the day and serving the cached result afterwards. Concurrent
+    requests on a cache miss wait for the same computation.
+    """
+    key = ('ETH', _utc_day())
+    result = _cache.get(key)
+    if result is not None:
+        return result
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_compute_and_cache(key))
+        # Retrieve the exception even if every caller was cancelled before it finished
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _inflight[key] = task
+    # Shielded so that one caller being cancelled doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+async def _compute_and_cache(key: tuple[str, int]) -> dict:
+    """
+    Computes the prediction for a cache miss and stores it under the given key.
+    """
+    try:
+        result = await _compute_prediction_values()
+    finally:
+        _inflight.pop(key, None)
+
+    # Only the current day's entry is ever read again
+    _cache.clear()
+    _cache[key] = result
+    return result
+
+async def _compute_prediction_values() -> dict:
     """
     Orchestrates the data fetching and prediction process using the ONNX model.
     """
@@ -14,22 +79,19 @@ def get_prediction_values() -> dict:
         raise ValueError("Model not available")
 
     # get_data_coinbase now returns a numpy array or None
-    input_data = get_data_coinbase('ETH')
+    input_data = await get_data_coinbase('ETH')
     
     if input_data is None or input_data.size == 0:
         logger.warning("Could not retrieve valid data for ETH. Aborting prediction.")
         raise ValueError("Invalid or empty data for ETH")
 
     try:
-        # The data is already a numpy array of the correct type and shape
-        input_name = onnx_session.get_inputs()[0].name
-        prediction_result = onnx_session.run(None, {input_name: input_data})
-        
-        eth_pred = float(prediction_result[0][0])
+        # Run inference off the event loop so concurrent requests aren't blocked
+        eth_pred = await asyncio.to_thread(_run_model, onnx_session, input_data)
         trend = 'positive' if eth_pred >= 0 else 'negative'
         
         return {"trend": trend, "value": eth_pred}
         
     except Exception as e:
-        logger.error(f"Error during ONNX model prediction: {e}", exc_info=True)
+        logger.error("Error during ONNX model prediction: %s", e, exc_info=True)
         raise
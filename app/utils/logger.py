@@ -1,11 +1,24 @@
 import logging
 import sys
+from contextvars import ContextVar
+
+# Set by the request-ID middleware; "-" outside of a request
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+class RequestIdFilter(logging.Filter):
+    """
+    Injects the current request ID into every log record as `request_id`.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
 
 def get_logger(name: str):
     logger = logging.getLogger(name)
     handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s - %(message)s')
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s [rid=%(request_id)s] - %(message)s')
     handler.setFormatter(formatter)
+    handler.addFilter(RequestIdFilter())
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
     return logger
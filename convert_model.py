@@ -3,11 +3,13 @@ import re
 from pathlib import Path
 from xgboost import XGBRegressor
 import onnxmltools
+import onnxruntime as rt
 from onnxmltools.convert.common.data_types import FloatTensorType
 
 # --- Configuration ---
 BASE_DIR = Path(__file__).resolve().parent
 ETH_MODEL_PATH_ONNX = BASE_DIR / "trained_models" / "model_eth.onnx"
+ETH_MODEL_PATH_ORT = BASE_DIR / "trained_models" / "model_eth.ort"
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def sanitize_feature_names(model):
@@ -64,6 +66,33 @@ def convert_model_to_onnx():
         logging.info(f"ONNX model saved successfully to: {ETH_MODEL_PATH_ONNX}")
     except Exception as e:
         logging.critical(f"Failed to save the ONNX model file. Error: {e}")
+        return
+
+    # 6. Convert the ONNX model to the ORT format used by the API.
+    # Note: the graph is a single ai.onnx.ml TreeEnsembleRegressor node whose thresholds
+    # and leaf values are node attributes. onnxruntime.quantization.quantize_dynamic (int8)
+    # only quantizes weight initializers of ops like MatMul/Gemm/Conv, and
+    # onnxconverter_common.float16.convert_float_to_float16 doesn't rewrite ai.onnx.ml
+    # attributes, so both leave it untouched. Quantization is therefore not applied here.
+    convert_onnx_to_ort(ETH_MODEL_PATH_ONNX, ETH_MODEL_PATH_ORT)
+
+def convert_onnx_to_ort(onnx_path: Path, ort_path: Path):
+    """
+    Serializes an ONNX model to the ORT flatbuffer format with graph optimizations
+    already applied, so the API doesn't have to parse and optimize it at startup.
+    This is what `python -m onnxruntime.tools.convert_onnx_models_to_ort` does,
+    without requiring the `onnx` package.
+    """
+    try:
+        so = rt.SessionOptions()
+        # EXTENDED keeps the saved graph portable (ENABLE_ALL adds hardware-specific layout transforms)
+        so.graph_optimization_level = rt.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        so.optimized_model_filepath = str(ort_path)
+        so.add_session_config_entry("session.save_model_format", "ORT")
+        rt.InferenceSession(str(onnx_path), sess_options=so, providers=["CPUExecutionProvider"])
+        logging.info(f"ORT model saved successfully to: {ort_path}")
+    except Exception as e:
+        logging.critical(f"Failed to convert the ONNX model to ORT format. Error: {e}")
 
 if __name__ == "__main__":
     convert_model_to_onnx()
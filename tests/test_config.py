@@ -0,0 +1,26 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from app.config import _env, _parse_list
+
+def test_env_matches_names_case_insensitively(mocker: MockerFixture):
+    """
+    Test that lowercase variable names are still picked up, as with pydantic-settings.
+    """
+    mocker.patch.dict('os.environ', {"allowed_origins": "https://a"}, clear=True)
+    assert _env("ALLOWED_ORIGINS", "*") == "https://a"
+    assert _env("ETH_MODEL_PATH", "default.ort") == "default.ort"
+
+def test_parse_list_formats():
+    """
+    Test that both JSON lists and comma-separated values are accepted.
+    """
+    assert _parse_list('["https://a", "https://b"]') == ["https://a", "https://b"]
+    assert _parse_list("https://a, https://b") == ["https://a", "https://b"]
+
+def test_parse_list_rejects_non_string_items():
+    """
+    Test that a JSON list with non-string items is rejected.
+    """
+    with pytest.raises(ValueError):
+        _parse_list('["https://a", 1]')
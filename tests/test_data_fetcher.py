@@ -0,0 +1,49 @@
+import asyncio
+import time
+import numpy as np
+from pytest_mock import MockerFixture
+
+from app.services.data_fetcher import get_data_coinbase
+
+# [timestamp, open, high, low, close, volume], oldest to newest
+OHLCV = [
+    [0, 0, 0, 0, 100.0, 0],
+    [1, 0, 0, 0, 110.0, 0],
+    [2, 0, 0, 0, 99.0, 0],
+    [3, 0, 0, 0, 99.0, 0],
+    [4, 0, 0, 0, 118.8, 0],
+]
+
+def test_get_data_coinbase_returns_lagged_pct_changes(mocker: MockerFixture):
+    """
+    Test that the features are [lag_1, lag_2, lag_3] with lag_1 being the most recent change.
+    """
+    exchange = mocker.patch('app.services.data_fetcher.get_exchange').return_value
+    exchange.fetch_ohlcv = mocker.AsyncMock(return_value=OHLCV)
+
+    features = asyncio.run(get_data_coinbase('ETH'))
+
+    assert features.shape == (1, 3)
+    assert features.dtype == np.float32
+    np.testing.assert_allclose(features, [[0.2, 0.0, -0.1]], rtol=1e-6)
+
+def test_get_data_coinbase_not_enough_data(mocker: MockerFixture):
+    """
+    Test that fewer than 4 candles yields no features.
+    """
+    exchange = mocker.patch('app.services.data_fetcher.get_exchange').return_value
+    exchange.fetch_ohlcv = mocker.AsyncMock(return_value=OHLCV[:3])
+
+    assert asyncio.run(get_data_coinbase('ETH')) is None
+
+def test_get_data_coinbase_ignores_todays_open_candle(mocker: MockerFixture):
+    """
+    Test that the still-open candle for the current UTC day doesn't feed the model.
+    """
+    todays_candle = [int(time.time() * 1000), 0, 0, 0, 1000.0, 0]
+    exchange = mocker.patch('app.services.data_fetcher.get_exchange').return_value
+    exchange.fetch_ohlcv = mocker.AsyncMock(return_value=OHLCV + [todays_candle])
+
+    features = asyncio.run(get_data_coinbase('ETH'))
+
+    np.testing.assert_allclose(features, [[0.2, 0.0, -0.1]], rtol=1e-6)
@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from app.main import app
 from pytest_mock import MockerFixture
+from app.utils.logger import request_id_var
 
 # Use a TestClient to make requests to the FastAPI app
 client = TestClient(app)
@@ -61,3 +62,37 @@ def test_prediction_error_handling(mocker: MockerFixture):
     assert data["tokenToBuy"] is None
     assert data["value"] is None
 
+
+def test_request_ids_are_unique():
+    """
+    Test that every response carries a distinct X-Request-ID header.
+    """
+    first = client.get("/").headers["X-Request-ID"]
+    second = client.get("/").headers["X-Request-ID"]
+    assert first and second
+    assert first != second
+
+def test_health():
+    """
+    Test the liveness endpoint returns 204 without a request ID.
+    """
+    response = client.get("/health")
+    assert response.status_code == 204
+    assert response.content == b""
+    assert "X-Request-ID" not in response.headers
+
+def test_request_id_is_available_to_handlers(mocker: MockerFixture):
+    """
+    Test that the request ID set by the middleware is visible inside the prediction pipeline.
+    """
+    seen = {}
+
+    async def fake_prediction():
+        seen["request_id"] = request_id_var.get()
+        return {"trend": "positive", "value": 0.05}
+
+    mocker.patch('app.main.get_prediction_values', side_effect=fake_prediction)
+
+    response = client.post("/prediction")
+
+    assert seen["request_id"] == response.headers["X-Request-ID"]
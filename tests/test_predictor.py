@@ -0,0 +1,95 @@
+import asyncio
+import numpy as np
+import onnxruntime as rt
+import pytest
+from pytest_mock import MockerFixture
+
+from app.config import settings
+from app.services import predictor
+from app.services.loader import load_model
+from app.services.predictor import get_prediction_values
+
+FEATURES = np.array([[0.01, -0.02, 0.03]], dtype=np.float32)
+
+@pytest.fixture(autouse=True)
+def clear_prediction_cache():
+    predictor._cache.clear()
+    yield
+    predictor._cache.clear()
+
+def test_prediction_matches_plain_session_run(mocker: MockerFixture):
+    """
+    Test that the IOBinding path returns the same value as a plain session.run.
+    """
+    mocker.patch('app.services.predictor.get_data_coinbase', return_value=FEATURES)
+    load_model()
+
+    sess = rt.InferenceSession(settings.eth_model_path)
+    expected = float(sess.run(None, {sess.get_inputs()[0].name: FEATURES})[0][0][0])
+
+    result = asyncio.run(get_prediction_values())
+
+    assert result["value"] == expected
+    assert result["trend"] == ('positive' if expected >= 0 else 'negative')
+
+def test_prediction_is_cached_per_utc_day(mocker: MockerFixture):
+    """
+    Test that repeated predictions within the same UTC day reuse the first result.
+    """
+    fetch = mocker.patch('app.services.predictor.get_data_coinbase', return_value=FEATURES)
+    day = mocker.patch('app.services.predictor._utc_day', return_value=20000)
+    load_model()
+
+    first = asyncio.run(get_prediction_values())
+    second = asyncio.run(get_prediction_values())
+    assert second is first
+    assert fetch.call_count == 1
+
+    day.return_value += 1
+    asyncio.run(get_prediction_values())
+    assert fetch.call_count == 2
+
+def test_concurrent_predictions_share_one_fetch(mocker: MockerFixture):
+    """
+    Test that concurrent cache misses trigger a single data fetch.
+    """
+    async def slow_fetch(ticker):
+        await asyncio.sleep(0.01)
+        return FEATURES
+
+    fetch = mocker.patch('app.services.predictor.get_data_coinbase', side_effect=slow_fetch)
+    load_model()
+
+    async def run_concurrently():
+        return await asyncio.gather(*(get_prediction_values() for _ in range(5)))
+
+    results = asyncio.run(run_concurrently())
+
+    assert fetch.call_count == 1
+    assert all(r == results[0] for r in results)
+    assert predictor._inflight == {}
+
+def test_cancelled_leader_does_not_cancel_waiters(mocker: MockerFixture):
+    """
+    Test that cancelling the request that started a computation doesn't fail the others waiting on it.
+    """
+    async def slow_fetch(ticker):
+        await asyncio.sleep(0.05)
+        return FEATURES
+
+    mocker.patch('app.services.predictor.get_data_coinbase', side_effect=slow_fetch)
+    load_model()
+
+    async def cancel_leader():
+        leader = asyncio.create_task(get_prediction_values())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(get_prediction_values())
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter, leader
+
+    result, leader = asyncio.run(cancel_leader())
+
+    assert leader.cancelled()
+    assert result["trend"] in ('positive', 'negative')
+    assert predictor._inflight == {}